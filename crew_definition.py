@@ -1,13 +1,395 @@
 from crewai import Agent, Crew, Task
 from testing.logging_config import get_logger
 from crewai.tools import tool
-from fredapi import Fred
 import os
+import asyncio
+import atexit
+import contextlib
+import contextvars
+import functools
+import threading
+from datetime import date
 from dotenv import load_dotenv
-import pandas as pd
-import numpy as np
+import diskcache
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar
 
-load_dotenv()
+# fredapi, pandas, numpy and httpx are imported inside the functions that use them,
+# so importing this module (and building the crew) stays cheap until a tool runs
+if TYPE_CHECKING:
+    import httpx
+    import numpy as np
+    import pandas as pd
+    from fredapi import Fred
+
+_T = TypeVar("_T")
+
+_FRED_API_ROOT = "https://api.stlouisfed.org/fred"
+# Default start of the observation window pulled for analysis; callers can pass an
+# earlier date when a query asks about older periods
+_OBSERVATION_START = "1990-01-01"
+
+@functools.lru_cache(maxsize=None)
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read a setting from the environment, loading .env on first use instead of at import."""
+    load_dotenv()
+    return os.getenv(name, default)
+
+def _cache_ttl() -> int:
+    """Seconds a cached FRED response stays valid (FRED_CACHE_TTL, default 3600)."""
+    return int(_env("FRED_CACHE_TTL", "3600"))
+
+_CACHE: Optional[diskcache.Cache] = None
+_CACHE_MISS = object()
+
+def _get_cache() -> diskcache.Cache:
+    """Return the shared on-disk cache for FRED API responses."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = diskcache.Cache(_env("FRED_CACHE_DIR", ".fred_cache"))
+    return _CACHE
+
+def _cache_key(fn_name: str, *args, **kwargs) -> tuple:
+    """Cache key for a FRED lookup; includes today's date so entries never outlive the day."""
+    return (fn_name, args, tuple(sorted(kwargs.items())), date.today().isoformat())
+
+class _CachedFred:
+    """Wraps a Fred client so repeated lookups are served from the on-disk cache."""
+    def __init__(self, fred: "Fred"):
+        self._fred = fred
+
+    def _cached(self, fn_name: str, *args, convert: Optional[Callable[[Any], Any]] = None, **kwargs) -> Any:
+        """Serve fn_name(*args, **kwargs) from the cache, storing convert(result) on a miss."""
+        cache = _get_cache()
+        key = _cache_key(fn_name, *args, **kwargs)
+        result = cache.get(key, default=_CACHE_MISS)
+        if result is _CACHE_MISS:
+            result = getattr(self._fred, fn_name)(*args, **kwargs)
+            if convert is not None:
+                result = convert(result)
+            cache.set(key, result, expire=_cache_ttl())
+        return result
+
+    def get_series(self, series_id: str, **kwargs) -> "pd.Series":
+        return self._cached("get_series", series_id, **kwargs)
+
+    def get_series_info(self, series_id: str) -> dict:
+        # fredapi returns a pandas Series; store it as a plain dict so the REST batch path,
+        # which shares this cache key, reads back the same type (and .get() stays cheap)
+        return self._cached("get_series_info", series_id, convert=lambda info: info.to_dict())
+
+    def search(self, text: str, **kwargs) -> Optional["pd.DataFrame"]:
+        return self._cached("search", text, **kwargs)
+
+_FRED: Optional[_CachedFred] = None
+
+def _get_fred() -> Optional[_CachedFred]:
+    """Return the shared, cache-backed FRED client, creating it on first use (None if no API key is set)."""
+    global _FRED
+    api_key = _env("FRED_API_KEY")
+    if _FRED is None and api_key:
+        from fredapi import Fred
+        _FRED = _CachedFred(Fred(api_key=api_key))
+    return _FRED
+
+async def _fetch_series(
+    client: "httpx.AsyncClient", series_id: str, observation_start: str
+) -> tuple[dict, "pd.Series"]:
+    """Fetch metadata and observations for one series straight from the FRED REST API."""
+    import numpy as np
+    import pandas as pd
+    
+    # Share cache entries with the fredapi-backed tools so either path can reuse the other's lookups
+    cache = _get_cache()
+    info_key = _cache_key("get_series_info", series_id)
+    data_key = _cache_key("get_series", series_id, observation_start=observation_start)
+    info = cache.get(info_key, default=_CACHE_MISS)
+    data = cache.get(data_key, default=_CACHE_MISS)
+    if info is not _CACHE_MISS and data is not _CACHE_MISS:
+        return info, data
+    
+    params = {"series_id": series_id, "api_key": _env("FRED_API_KEY"), "file_type": "json"}
+    info_response, obs_response = await asyncio.gather(
+        client.get(f"{_FRED_API_ROOT}/series", params=params),
+        client.get(
+            f"{_FRED_API_ROOT}/series/observations",
+            params={**params, "observation_start": observation_start},
+        ),
+    )
+    for response in (info_response, obs_response):
+        if response.status_code != 200:
+            # Gateway errors (502/503) come back as HTML, so only trust a JSON body
+            try:
+                message = response.json().get("error_message")
+            except ValueError:
+                message = None
+            raise ValueError(message or f"HTTP {response.status_code}")
+    
+    seriess = info_response.json().get("seriess") or []
+    if not seriess:
+        raise ValueError(f"No info exists for series id: {series_id}")
+    
+    # FRED marks missing observations with "." - coerce those to NaN like fredapi does
+    observations = obs_response.json().get("observations", [])
+    data = pd.Series(
+        pd.to_numeric([obs["value"] for obs in observations], errors="coerce"),
+        index=pd.to_datetime([obs["date"] for obs in observations]),
+        dtype=np.float64,
+    )
+    info = seriess[0]
+    cache.set(info_key, info, expire=_cache_ttl())
+    cache.set(data_key, data, expire=_cache_ttl())
+    return info, data
+
+# Batch fetches run on one long-lived event loop in a background thread, so a single
+# pooled AsyncClient keeps its keep-alive connections to the FRED API between calls
+_ASYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+_HTTP_CLIENT: Optional["httpx.AsyncClient"] = None
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop used for FRED HTTP calls, starting it on first use."""
+    global _ASYNC_LOOP
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="fred-http", daemon=True).start()
+            atexit.register(_close_http_client, loop)
+            _ASYNC_LOOP = loop
+    return _ASYNC_LOOP
+
+def _get_http_client() -> "httpx.AsyncClient":
+    """Return the shared AsyncClient; only ever called from the background loop."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        import httpx
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _HTTP_CLIENT
+
+def _close_http_client(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the shared AsyncClient at interpreter exit."""
+    if _HTTP_CLIENT is not None:
+        asyncio.run_coroutine_threadsafe(_HTTP_CLIENT.aclose(), loop).result(timeout=5)
+
+async def _fetch_all_series(series_ids: list[str], observation_start: str) -> list:
+    """Fetch several series concurrently over the shared HTTP client; failures are returned, not raised."""
+    client = _get_http_client()
+    return await asyncio.gather(
+        *(_fetch_series(client, series_id, observation_start) for series_id in series_ids),
+        return_exceptions=True,
+    )
+
+def _run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine on the background loop and block until it finishes (safe from any thread)."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result()
+
+def _series_stats(arr: "np.ndarray") -> dict:
+    """
+    Historical statistics for one series, computed on the materialized array rather than
+    through repeated pandas reductions (NaN-aware to match pandas' skipna). The percentile
+    is the share of observations strictly below the latest one.
+    """
+    import numpy as np
+    
+    return {
+        "mean": np.nanmean(arr),
+        "std": np.nanstd(arr, ddof=1),
+        "min_idx": np.nanargmin(arr),
+        "max_idx": np.nanargmax(arr),
+        # NaN compares False, so a missing latest value ranks at 0
+        "percentile": np.count_nonzero(arr < arr[-1]) / arr.size * 100,
+    }
+
+def _analyze_series(series_id: str, info: dict, data: "pd.Series") -> dict:
+    """
+    Compute the analysis for one non-empty series as a plain dict of scalars and arrays
+    (current value, MoM/YoY changes, historical context and recent data points).
+    """
+    import numpy as np
+    import pandas as pd
+    
+    # Materialize the values once; scalar reads below index the array directly
+    arr: "np.ndarray" = data.to_numpy(dtype=np.float64)
+    n_obs: int = len(arr)
+    index = data.index
+    
+    # Calculate metrics
+    current_value: float = arr[-1]
+    
+    # MoM change (if monthly or higher frequency)
+    mom_change: Optional[float] = None
+    mom_pct: Optional[float] = None
+    if n_obs >= 2:
+        prev_value = arr[-2]
+        mom_change = current_value - prev_value
+        if prev_value != 0:
+            mom_pct = (mom_change / prev_value) * 100
+    
+    # YoY change (if the data reaches back a year). The year-ago point is found by date,
+    # since rows per year vary (daily series have weekday or calendar-day rows)
+    yoy_change: Optional[float] = None
+    yoy_pct: Optional[float] = None
+    year_ago = index[-1] - pd.DateOffset(years=1)
+    if index[0] <= year_ago:
+        # Last observation on or before the year-ago date; holidays are NaN in daily
+        # series, so fall back to the last valid point before it
+        year_ago_pos = index.searchsorted(year_ago, side='right') - 1
+        valid = np.flatnonzero(~np.isnan(arr[:year_ago_pos + 1]))
+        if valid.size:
+            year_ago_value = arr[valid[-1]]
+            yoy_change = current_value - year_ago_value
+            if year_ago_value != 0:
+                yoy_pct = (yoy_change / year_ago_value) * 100
+    
+    # Historical statistics
+    stats = _series_stats(arr)
+    mean_value: float = stats["mean"]
+    std_value: float = stats["std"]
+    min_idx = stats["min_idx"]
+    max_idx = stats["max_idx"]
+    
+    # Standard deviations from mean
+    std_from_mean: float = (current_value - mean_value) / std_value if std_value != 0 else 0
+    
+    recent_slice = slice(-15, None)
+    
+    return {
+        "series_id": series_id,
+        "title": info.get('title', series_id),
+        "frequency": info.get('frequency', 'N/A'),
+        "units": info.get('units', 'N/A'),
+        "seasonal_adjustment": info.get('seasonal_adjustment', 'N/A'),
+        "current_value": current_value,
+        "current_date": index[-1].strftime('%Y-%m-%d'),
+        "metrics": {
+            "mom_change": mom_change,
+            "mom_pct": mom_pct,
+            "yoy_change": yoy_change,
+            "yoy_pct": yoy_pct,
+            # 3-month or 3-period average
+            "period_avg": np.nanmean(arr[-3:]) if n_obs >= 3 else current_value,
+        },
+        "history": {
+            "mean": mean_value,
+            "std": std_value,
+            "min": arr[min_idx],
+            "min_date": index[min_idx].strftime('%Y-%m-%d'),
+            "max": arr[max_idx],
+            "max_date": index[max_idx].strftime('%Y-%m-%d'),
+            "percentile": stats["percentile"],
+            "std_from_mean": std_from_mean,
+            "start_date": index[0].strftime('%Y-%m-%d'),
+            # First observation FRED has for the series, which can predate start_date
+            "series_start": str(info.get('observation_start') or '')[:10],
+            "start_value": arr[0],
+            "observations": n_obs,
+        },
+        "recent_dates": index[recent_slice].strftime('%Y-%m-%d').to_numpy(),
+        "recent_values": arr[recent_slice],
+    }
+
+def _render_series_analysis(analysis: dict) -> str:
+    """Render an _analyze_series() result as the text report handed to the agents."""
+    import numpy as np
+    
+    series_id = analysis["series_id"]
+    current_value = analysis["current_value"]
+    metrics = analysis["metrics"]
+    history = analysis["history"]
+    
+    # Build comprehensive output as a list of lines, joined once at the end
+    parts: list[str] = [
+        f"=== SERIES ANALYSIS: {analysis['title']} ===",
+        "",
+        "📊 CURRENT DATA:",
+        f"Series ID: {series_id}",
+        f"Current Value: {'N/A' if np.isnan(current_value) else f'{current_value:.2f}'}",
+        f"Date: {analysis['current_date']}",
+        f"Frequency: {analysis['frequency']}",
+        f"Units: {analysis['units']}",
+        f"Seasonal Adjustment: {analysis['seasonal_adjustment']}",
+        "",
+        "📈 CALCULATED METRICS:",
+    ]
+    if metrics["mom_change"] is not None:
+        pct = f" ({metrics['mom_pct']:+.2f}%)" if metrics["mom_pct"] is not None else ""
+        parts.append(f"Month-over-Month Change: {metrics['mom_change']:+.2f}{pct}")
+    if metrics["yoy_change"] is not None:
+        pct = f" ({metrics['yoy_pct']:+.2f}%)" if metrics["yoy_pct"] is not None else ""
+        parts.append(f"Year-over-Year Change: {metrics['yoy_change']:+.2f}{pct}")
+    # History is only what was retrieved from observation_start onwards, so every
+    # "historical" figure names its window rather than reading as the full record;
+    # the caveat is only added when the series really goes back further
+    since = f"since {history['start_date']}"
+    window = since
+    if history["series_start"] and history["series_start"] < history["start_date"]:
+        window += f"; series starts {history['series_start']}, earlier data not retrieved"
+    parts += [
+        f"3-Period Average: {metrics['period_avg']:.2f}",
+        "",
+        f"📉 HISTORICAL CONTEXT ({window}):",
+        f"Historical Mean ({since}): {history['mean']:.2f}",
+        f"Standard Deviation ({since}): {history['std']:.2f}",
+        f"Historical Range ({since}): {history['min']:.2f} to {history['max']:.2f}",
+        f"Current Percentile Rank ({since}): {history['percentile']:.1f}th percentile",
+        f"Distance from Mean: {history['std_from_mean']:+.2f} standard deviations",
+        f"Data Range: {history['start_date']} to {analysis['current_date']}",
+        f"Total Observations: {history['observations']}",
+        "",
+        "📋 RECENT DATA POINTS (Last 15):",
+    ]
+    recent_raw = analysis["recent_values"]
+    recent_values = np.where(np.isnan(recent_raw), 'N/A', np.char.mod('%.2f', recent_raw))
+    parts.extend("  " + analysis["recent_dates"] + ": " + recent_values)
+    
+    # Add summary of full dataset
+    parts += [
+        "",
+        f"📊 RETRIEVED DATA SUMMARY ({since}):",
+        f"Total data points retrieved: {history['observations']}",
+        f"Oldest retrieved data: {history['start_date']} = {history['start_value']:.2f}",
+        f"Newest data: {analysis['current_date']} = {current_value:.2f}",
+        f"Average over retrieved period: {history['mean']:.2f}",
+        f"Peak value {since}: {history['max']:.2f} on {history['max_date']}",
+        f"Trough value {since}: {history['min']:.2f} on {history['min_date']}",
+        "",
+        f"🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}",
+        "",
+    ]
+    
+    return "\n".join(parts)
+
+def _format_series_analysis(series_id: str, info: dict, data: "pd.Series") -> str:
+    """Build the analysis report for one series from its metadata and observations."""
+    if data.empty:
+        return f"No data available for series ID: {series_id}"
+    return _render_series_analysis(_analyze_series(series_id, info, data))
+
+# Error messages returned by the FRED tools during the current crew run, when a caller
+# is tracking them. crewai copies the context into any worker threads it runs tools on,
+# so the list is shared with the tools wherever they execute.
+_TOOL_ERRORS: contextvars.ContextVar[Optional[list[str]]] = contextvars.ContextVar(
+    "fred_tool_errors", default=None
+)
+
+@contextlib.contextmanager
+def track_tool_errors():
+    """Collect the error messages the FRED tools return while the block runs."""
+    errors: list[str] = []
+    token = _TOOL_ERRORS.set(errors)
+    try:
+        yield errors
+    finally:
+        _TOOL_ERRORS.reset(token)
+
+def _tool_error(message: str) -> str:
+    """Record a tool failure for track_tool_errors() and return the message for the agent."""
+    errors = _TOOL_ERRORS.get()
+    if errors is not None:
+        errors.append(message)
+    return message
 
 @tool("FRED Search Tool")
 def fred_search_tool(query: str) -> str:
@@ -16,134 +398,89 @@ def fred_search_tool(query: str) -> str:
     Returns series IDs, titles, and descriptions of matching datasets.
     """
     try:
-        fred_api_key = os.getenv("FRED_API_KEY")
-        if not fred_api_key:
-            return "Error: FRED_API_KEY not found in environment variables. Please add it to your .env file."
+        fred = _get_fred()
+        if fred is None:
+            return _tool_error("Error: FRED_API_KEY not found in environment variables. Please add it to your .env file.")
         
-        fred = Fred(api_key=fred_api_key)
         results = fred.search(query, limit=10)
         
-        if results.empty:
+        if results is None or results.empty:
             return f"No results found for query: '{query}'"
         
+        # Pull each column out once as an array instead of boxing every row with iterrows()
+        titles = results['title'].fillna('N/A').to_numpy()
+        notes = results['notes'].fillna('No description available').astype(str).str[:200].to_numpy()
+        freqs = results['frequency_short'].fillna('N/A').to_numpy()
+        units = results['units_short'].fillna('N/A').to_numpy()
+        ids = results.index.to_numpy()
+        entries = [
+            f"{idx}. {title} (ID: {sid})\n"
+            f"   Description: {note}...\n"
+            f"   Frequency: {freq} | Units: {unit}\n"
+            for idx, (title, sid, note, freq, unit) in enumerate(zip(titles, ids, notes, freqs, units), 1)
+        ]
+        
         output = f"Found {len(results)} series matching '{query}':\n\n"
-        for idx, (series_id, row) in enumerate(results.iterrows(), 1):
-            output += f"{idx}. {row.get('title', 'N/A')} (ID: {series_id})\n"
-            output += f"   Description: {row.get('notes', 'No description available')[:200]}...\n"
-            output += f"   Frequency: {row.get('frequency_short', 'N/A')} | Units: {row.get('units_short', 'N/A')}\n\n"
+        output += "\n".join(entries) + "\n"
         
         return output
     except Exception as e:
-        return f"Error searching FRED: {str(e)}"
+        return _tool_error(f"Error searching FRED: {str(e)}")
 
 @tool("FRED Data Retrieval Tool")
-def fred_data_tool(series_id: str) -> str:
+def fred_data_tool(series_id: str, observation_start: str = _OBSERVATION_START) -> str:
     """
     Retrieve actual economic data from FRED for a specific series ID with comprehensive analysis.
     Returns recent data points, calculated metrics (MoM, YoY, percentiles), and statistical context.
+    Data is retrieved from observation_start (YYYY-MM-DD, default 1990-01-01) onwards; pass an
+    earlier date when the query asks about older periods.
     """
     try:
-        fred_api_key = os.getenv("FRED_API_KEY")
-        if not fred_api_key:
-            return "Error: FRED_API_KEY not found in environment variables."
-        
-        fred = Fred(api_key=fred_api_key)
+        fred = _get_fred()
+        if fred is None:
+            return _tool_error("Error: FRED_API_KEY not found in environment variables.")
         
         # Get series info
         info = fred.get_series_info(series_id)
         
-        # Get complete data history
-        data = fred.get_series(series_id)
-        
-        if data.empty:
-            return f"No data available for series ID: {series_id}"
-        
-        # Get recent data points (last 24 for comprehensive analysis - 2 years monthly or 6 years quarterly)
-        recent_data = data.tail(24)
-        
-        # Calculate metrics
-        current_value = data.iloc[-1]
-        
-        # MoM change (if monthly or higher frequency)
-        mom_change = None
-        mom_pct = None
-        if len(data) >= 2:
-            prev_value = data.iloc[-2]
-            mom_change = current_value - prev_value
-            if prev_value != 0:
-                mom_pct = (mom_change / prev_value) * 100
-        
-        # YoY change (if we have 12+ months of data)
-        yoy_change = None
-        yoy_pct = None
-        freq = info.get('frequency_short', 'N/A')
-        lookback = 12 if freq in ['M', 'Monthly'] else 4 if freq in ['Q', 'Quarterly'] else 1
-        if len(data) >= lookback + 1:
-            year_ago_value = data.iloc[-(lookback + 1)]
-            yoy_change = current_value - year_ago_value
-            if year_ago_value != 0:
-                yoy_pct = (yoy_change / year_ago_value) * 100
-        
-        # Historical statistics
-        mean_value = data.mean()
-        std_value = data.std()
-        min_value = data.min()
-        max_value = data.max()
-        
-        # Percentile rank of current value
-        percentile = (data < current_value).sum() / len(data) * 100
-        
-        # Standard deviations from mean
-        std_from_mean = (current_value - mean_value) / std_value if std_value != 0 else 0
-        
-        # 3-month or 3-period average
-        period_avg = data.tail(3).mean() if len(data) >= 3 else current_value
-        
-        # Build comprehensive output with FIXED f-string syntax
-        output = f"=== SERIES ANALYSIS: {info.get('title', series_id)} ===\n\n"
-        output += f"📊 CURRENT DATA:\n"
-        output += f"Series ID: {series_id}\n"
-        # FIXED: Proper f-string syntax
-        output += f"Current Value: {'N/A' if pd.isna(current_value) else f'{current_value:.2f}'}\n"
-        output += f"Date: {data.index[-1].strftime('%Y-%m-%d')}\n"
-        output += f"Frequency: {info.get('frequency', 'N/A')}\n"
-        output += f"Units: {info.get('units', 'N/A')}\n"
-        output += f"Seasonal Adjustment: {info.get('seasonal_adjustment', 'N/A')}\n\n"
+        # Get data history from the requested start date
+        data = fred.get_series(series_id, observation_start=observation_start)
         
-        output += f"📈 CALCULATED METRICS:\n"
-        if mom_change is not None:
-            output += f"Month-over-Month Change: {mom_change:+.2f} ({mom_pct:+.2f}%)\n"
-        if yoy_change is not None:
-            output += f"Year-over-Year Change: {yoy_change:+.2f} ({yoy_pct:+.2f}%)\n"
-        output += f"3-Period Average: {period_avg:.2f}\n\n"
-        
-        output += f"📉 HISTORICAL CONTEXT:\n"
-        output += f"Historical Mean: {mean_value:.2f}\n"
-        output += f"Standard Deviation: {std_value:.2f}\n"
-        output += f"Historical Range: {min_value:.2f} to {max_value:.2f}\n"
-        output += f"Current Percentile Rank: {percentile:.1f}th percentile\n"
-        output += f"Distance from Mean: {std_from_mean:+.2f} standard deviations\n"
-        output += f"Data Range: {data.index[0].strftime('%Y-%m-%d')} to {data.index[-1].strftime('%Y-%m-%d')}\n"
-        output += f"Total Observations: {len(data)}\n\n"
+        return _format_series_analysis(series_id, info, data)
+    except Exception as e:
+        return _tool_error(f"Error retrieving data for {series_id}: {str(e)}")
+
+@tool("FRED Batch Data Retrieval Tool")
+def fred_batch_data_tool(series_ids: str, observation_start: str = _OBSERVATION_START) -> str:
+    """
+    Retrieve economic data for several FRED series at once. Pass a comma-separated list of
+    series IDs (e.g. "UNRATE, CPIAUCSL, FEDFUNDS"). All series are fetched concurrently and each
+    gets the same analysis as the FRED Data Retrieval Tool. Prefer this for multi-indicator queries.
+    Data is retrieved from observation_start (YYYY-MM-DD, default 1990-01-01) onwards.
+    """
+    try:
+        if not _env("FRED_API_KEY"):
+            return _tool_error("Error: FRED_API_KEY not found in environment variables.")
         
-        output += f"📋 RECENT DATA POINTS (Last 15):\n"
-        for date, value in recent_data.tail(15).items():
-            output += f"  {date.strftime('%Y-%m-%d')}: {value:.2f}\n"
+        ids = list(dict.fromkeys(sid.strip() for sid in series_ids.split(",") if sid.strip()))
+        if not ids:
+            return _tool_error("Error: No series IDs provided. Pass a comma-separated list such as 'UNRATE, CPIAUCSL'.")
         
-        # Add summary of full dataset
-        output += f"\n📊 FULL DATASET SUMMARY:\n"
-        output += f"Total data points retrieved: {len(data)}\n"
-        output += f"Oldest data: {data.index[0].strftime('%Y-%m-%d')} = {data.iloc[0]:.2f}\n"
-        output += f"Newest data: {data.index[-1].strftime('%Y-%m-%d')} = {data.iloc[-1]:.2f}\n"
-        output += f"Average over entire period: {mean_value:.2f}\n"
-        output += f"Peak value: {max_value:.2f} on {data.idxmax().strftime('%Y-%m-%d')}\n"
-        output += f"Trough value: {min_value:.2f} on {data.idxmin().strftime('%Y-%m-%d')}\n"
+        results = _run_async(_fetch_all_series(ids, observation_start))
         
-        output += f"\n🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}\n"
+        sections = []
+        for series_id, result in zip(ids, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                info, data = result
+                sections.append(_format_series_analysis(series_id, info, data))
+            except Exception as e:
+                sections.append(_tool_error(f"Error retrieving data for {series_id}: {str(e)}"))
         
-        return output
+        return "\n\n".join(sections)
     except Exception as e:
-        return f"Error retrieving data for {series_id}: {str(e)}"
+        return _tool_error(f"Error retrieving batch data for {series_ids}: {str(e)}")
 
 @tool("FRED Series Info Tool")
 def fred_series_info_tool(series_id: str) -> str:
@@ -151,49 +488,38 @@ def fred_series_info_tool(series_id: str) -> str:
     Get detailed information about a FRED data series including metadata and source information.
     """
     try:
-        fred_api_key = os.getenv("FRED_API_KEY")
-        if not fred_api_key:
-            return "Error: FRED_API_KEY not found in environment variables."
-        
-        fred = Fred(api_key=fred_api_key)
+        fred = _get_fred()
+        if fred is None:
+            return _tool_error("Error: FRED_API_KEY not found in environment variables.")
         info = fred.get_series_info(series_id)
         
-        output = f"Series Information for {series_id}:\n\n"
-        output += f"Title: {info.get('title', 'N/A')}\n"
-        output += f"Observation Start: {info.get('observation_start', 'N/A')}\n"
-        output += f"Observation End: {info.get('observation_end', 'N/A')}\n"
-        output += f"Frequency: {info.get('frequency', 'N/A')}\n"
-        output += f"Units: {info.get('units', 'N/A')}\n"
-        output += f"Seasonal Adjustment: {info.get('seasonal_adjustment', 'N/A')}\n"
-        output += f"Last Updated: {info.get('last_updated', 'N/A')}\n"
-        output += f"Popularity: {info.get('popularity', 'N/A')}\n\n"
-        output += f"Notes: {info.get('notes', 'No notes available')}\n\n"
-        output += f"🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}\n"
+        parts: list[str] = [
+            f"Series Information for {series_id}:",
+            "",
+            f"Title: {info.get('title', 'N/A')}",
+            f"Observation Start: {info.get('observation_start', 'N/A')}",
+            f"Observation End: {info.get('observation_end', 'N/A')}",
+            f"Frequency: {info.get('frequency', 'N/A')}",
+            f"Units: {info.get('units', 'N/A')}",
+            f"Seasonal Adjustment: {info.get('seasonal_adjustment', 'N/A')}",
+            f"Last Updated: {info.get('last_updated', 'N/A')}",
+            f"Popularity: {info.get('popularity', 'N/A')}",
+            "",
+            f"Notes: {info.get('notes', 'No notes available')}",
+            "",
+            f"🔗 View on FRED: https://fred.stlouisfed.org/series/{series_id}",
+            "",
+        ]
         
-        return output
+        return "\n".join(parts)
     except Exception as e:
-        return f"Error getting info for {series_id}: {str(e)}"
+        return _tool_error(f"Error getting info for {series_id}: {str(e)}")
 
 
-class FREDEconomicCrew:
-    """
-    A specialized CrewAI crew for querying and analyzing FRED economic data.
-    Enhanced with analytical capabilities for comprehensive economic analysis.
-    """
-    def __init__(self, verbose=True, logger=None):
-        self.verbose = verbose
-        self.logger = logger or get_logger(__name__)
-        self.crew = self.create_crew()
-        self.logger.info("FRED Economic Crew initialized")
+# Agent backstories and task prompts, defined once at import rather than rebuilt
+# as literals on every create_crew() call
 
-    def create_crew(self):
-        self.logger.info("Creating FRED economic data crew")
-        
-        # Agent 1: FRED Data Analyst - Enhanced with analytical requirements
-        fred_analyst = Agent(
-            role='Senior FRED Data Analyst',
-            goal='Retrieve ALL relevant economic data series requested and provide comprehensive statistical analysis',
-            backstory="""You are a senior economic data analyst with deep expertise in the Federal Reserve 
+_FRED_ANALYST_BACKSTORY = """You are a senior economic data analyst with deep expertise in the Federal Reserve 
             Economic Data (FRED) database. You have a PhD in Economics and 15 years of experience analyzing 
             economic indicators. You are meticulous about retrieving ALL data series mentioned in queries - 
             if someone asks for 3 metrics, you retrieve ALL 3, not just one. You understand economic terminology, 
@@ -206,16 +532,9 @@ class FREDEconomicCrew:
               the requested data is not available in FRED. DO NOT make up data or provide generic responses.
             - You ONLY work with Federal Reserve Economic Data. If a query is clearly outside economics 
               (e.g., weather, recipes, entertainment), politely inform the user this is outside your scope.
-            - Never hallucinate data. If you cannot retrieve actual data, say so explicitly.""",
-            tools=[fred_search_tool, fred_data_tool, fred_series_info_tool],
-            verbose=self.verbose
-        )
+            - Never hallucinate data. If you cannot retrieve actual data, say so explicitly."""
 
-        # Agent 2: Economic Advisor - Enhanced to provide structured, actionable analysis
-        economic_advisor = Agent(
-            role='Chief Economic Interpreter',
-            goal='Transform raw economic data into actionable insights with historical context and clear implications',
-            backstory="""You are the Chief Economist at a major financial institution with 20 years of experience 
+_ECONOMIC_ADVISOR_BACKSTORY = """You are the Chief Economist at a major financial institution with 20 years of experience 
             interpreting economic data for investors, policymakers, and business leaders. You never just report 
             numbers - you ANALYZE them. You always provide:
             
@@ -237,30 +556,24 @@ class FREDEconomicCrew:
               information is not available in FRED. Provide helpful suggestions for alternative queries.
             - Never provide analysis without actual data. Never hallucinate numbers.
             - If the query is outside the scope of FRED economic data, politely explain the agent's 
-              limitations and what types of queries it can handle.""",
-            verbose=self.verbose
-        )
+              limitations and what types of queries it can handle."""
 
-        self.logger.info("Created enhanced FRED analyst and economic advisor agents")
-
-        crew = Crew(
-            agents=[fred_analyst, economic_advisor],
-            tasks=[
-                Task(
-                    description="""Analyze this economic data query and retrieve ALL relevant data: {text}
+_TASK1_DESC = """Analyze this economic data query and retrieve ALL relevant data: {text}
                     
                     CRITICAL REQUIREMENTS:
                     1. Identify EVERY economic indicator mentioned in the query
                     2. If the query asks for multiple metrics (e.g., "compare A, B, and C"), retrieve ALL of them
-                    3. If the query mentions specific time periods (e.g., "2008 crisis"), retrieve data from that period
-                    4. Use fred_data_tool to get actual data with calculations - don't just search
+                    3. If the query mentions specific time periods (e.g., "2008 crisis"), retrieve data from that period -
+                       data tools start at 1990-01-01 by default, so pass an earlier observation_start for older periods
+                    4. Use fred_data_tool (one series) or fred_batch_data_tool (several series) to get actual data with calculations - don't just search
                     5. Retrieve enough historical data to provide meaningful context
                     6. If a tool fails 2-3 times, try alternative series IDs or report the issue
                     
                     STEPS:
                     1. Parse query to identify ALL indicators requested
                     2. Search FRED for each indicator
-                    3. Retrieve data for each relevant series using fred_data_tool
+                    3. Retrieve data for all relevant series - when there are several, fetch them together in ONE
+                       fred_batch_data_tool call with comma-separated series IDs; use fred_data_tool for a single series
                     4. Verify you've retrieved data for EVERY part of the query
                     
                     EARLY EXIT CONDITIONS (Stop immediately and report):
@@ -275,18 +588,17 @@ class FREDEconomicCrew:
                     - Never skip historical periods specifically mentioned
                     - Never retry the same failing tool more than 3 times
                     - Never fabricate data when retrieval fails
-                    """,
-                    expected_output="""Complete data retrieval including:
+                    """
+
+_TASK1_EXPECTED_OUTPUT = """Complete data retrieval including:
                     - Actual data values for ALL series mentioned in query
                     - Calculated metrics (MoM, YoY, percentiles) for each series
                     - Historical context data if requested
                     - All series metadata and FRED links
                     - Clear indication if any data retrieval failed
-                    - If NO data found: explicit message stating data is unavailable with suggestions""",
-                    agent=fred_analyst
-                ),
-                Task(
-                    description="""Transform the retrieved FRED data into a comprehensive, actionable analysis.
+                    - If NO data found: explicit message stating data is unavailable with suggestions"""
+
+_TASK2_DESC = """Transform the retrieved FRED data into a comprehensive, actionable analysis.
                     
                     REQUIRED STRUCTURE:
                     
@@ -339,15 +651,63 @@ class FREDEconomicCrew:
                     - Never report numbers without explaining if they're high/low
                     - Never forget to format with clear sections
                     - Never fabricate data if retrieval failed
-                    - Never provide fake analysis when no data exists""",
-                    expected_output="""Structured economic analysis with:
+                    - Never provide fake analysis when no data exists"""
+
+_TASK2_EXPECTED_OUTPUT = """Structured economic analysis with:
                     - Executive summary with key findings
                     - Detailed analysis with all requested metrics and calculated changes
                     - Historical context with percentile rankings
                     - Clear interpretation for different stakeholders
                     - Actionable recommendations
                     - Query-specific related series suggestions
-                    - Proper formatting with sections and tables""",
+                    - Proper formatting with sections and tables"""
+
+
+class FREDEconomicCrew:
+    """
+    A specialized CrewAI crew for querying and analyzing FRED economic data.
+    Enhanced with analytical capabilities for comprehensive economic analysis.
+    """
+    def __init__(self, verbose=True, logger=None):
+        load_dotenv()
+        self.verbose = verbose
+        self.logger = logger or get_logger(__name__)
+        self.crew = self.create_crew()
+        self.logger.info("FRED Economic Crew initialized")
+
+    def create_crew(self):
+        self.logger.info("Creating FRED economic data crew")
+        
+        # Agent 1: FRED Data Analyst - Enhanced with analytical requirements
+        fred_analyst = Agent(
+            role='Senior FRED Data Analyst',
+            goal='Retrieve ALL relevant economic data series requested and provide comprehensive statistical analysis',
+            backstory=_FRED_ANALYST_BACKSTORY,
+            tools=[fred_search_tool, fred_data_tool, fred_batch_data_tool, fred_series_info_tool],
+            verbose=self.verbose
+        )
+
+        # Agent 2: Economic Advisor - Enhanced to provide structured, actionable analysis
+        economic_advisor = Agent(
+            role='Chief Economic Interpreter',
+            goal='Transform raw economic data into actionable insights with historical context and clear implications',
+            backstory=_ECONOMIC_ADVISOR_BACKSTORY,
+            verbose=self.verbose
+        )
+
+        self.logger.info("Created enhanced FRED analyst and economic advisor agents")
+
+        crew = Crew(
+            agents=[fred_analyst, economic_advisor],
+            tasks=[
+                Task(
+                    description=_TASK1_DESC,
+                    expected_output=_TASK1_EXPECTED_OUTPUT,
+                    agent=fred_analyst
+                ),
+                Task(
+                    description=_TASK2_DESC,
+                    expected_output=_TASK2_EXPECTED_OUTPUT,
                     agent=economic_advisor
                 )
             ],
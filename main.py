@@ -21,18 +21,105 @@ Required environment variables for API mode:
     - NETWORK: Network to use - 'Preprod' or 'Mainnet' (optional, defaults to 'Preprod')
     - OPENAI_API_KEY: OpenAI API key for CrewAI (REQUIRED)
     - FRED_API_KEY: FRED API key for economic data (REQUIRED)
+
+Optional tuning:
+    - CREW_WORKERS: Threads running crew jobs (optional, defaults to 8)
+    - CREW_CONCURRENCY: Crew jobs allowed to run at once (optional, defaults to CREW_WORKERS)
+    - QUERY_CACHE_DIR: Directory for cached query answers (optional, defaults to '.query_cache')
+    - QUERY_CACHE_TTL: Seconds a query answer is reused; 0 disables the cache (optional, defaults to 3600)
+    - FRED_CACHE_DIR: Directory for cached FRED API responses (optional, defaults to '.fred_cache')
+    - FRED_CACHE_TTL: Seconds a FRED API response is reused (optional, defaults to 3600)
+    - LOG_LEVEL: Minimum level written to logs/app.log (optional, defaults to 'INFO')
 """
 
 import os
+import asyncio
+import functools
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import diskcache
+from dotenv import load_dotenv
 from masumi import run
-from crew_definition import FREDEconomicCrew
+from crew_definition import FREDEconomicCrew, track_tool_errors
 from testing.logging_config import setup_logging
 
-# Note: .env files are automatically loaded by masumi.run() from the current directory
+# masumi.run() loads .env too, but only after this module has been imported; the
+# worker, cache and log settings below are read at import, so load it up front
+load_dotenv()
 
 # Configure logging
 logger = setup_logging()
 
+# crew.kickoff() is blocking (LLM round-trips + FRED HTTP), so it runs on this pool
+# and the event loop stays free for status, health and payment requests meanwhile
+CREW_WORKERS = int(os.getenv("CREW_WORKERS", 8))
+CREW_EXECUTOR = ThreadPoolExecutor(max_workers=CREW_WORKERS, thread_name_prefix="crew")
+
+# Admission control for crew runs: when many paid jobs land at once, the extra ones
+# wait here instead of piling LLM and FRED connections into the executor queue
+CREW_SEM = asyncio.Semaphore(int(os.getenv("CREW_CONCURRENCY", CREW_WORKERS)))
+
+# Agents and tasks are pure configuration, so crews are built lazily and reused
+# across jobs; only kickoff() runs per request. A crew carries state while it runs,
+# so each executor thread keeps its own instance instead of sharing one.
+_CREW_LOCAL = threading.local()
+
+
+def _get_crew() -> FREDEconomicCrew:
+    """Return this thread's FRED crew, creating it on first use."""
+    crew = getattr(_CREW_LOCAL, "crew", None)
+    if crew is None:
+        crew = _CREW_LOCAL.crew = FREDEconomicCrew(logger=logger)
+    return crew
+
+
+# Answers to popular questions ("current unemployment rate") barely change within an
+# hour, so finished crew outputs are kept on disk and survive restarts
+QUERY_CACHE = diskcache.Cache(os.getenv("QUERY_CACHE_DIR", ".query_cache"))
+
+
+def cache_aside(ttl: int):
+    """
+    Cache a text-query function's results in QUERY_CACHE for ttl seconds (ttl <= 0
+    disables caching).
+    
+    Keys are a blake2b hash of the stripped, lower-cased query, so trivially different
+    phrasings of the same text share an entry. Answers are only stored when no FRED tool
+    returned an error during the run: the crew still answers after a failed lookup
+    ("Unable to retrieve data..."), and that answer must not outlive the outage.
+    """
+    def decorator(fn):
+        if ttl <= 0:
+            return fn
+        
+        @functools.wraps(fn)
+        def wrapper(text: str) -> str:
+            normalized = text.strip().lower()
+            key = "fred:q:" + hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+            result = QUERY_CACHE.get(key)
+            if result is None:
+                with track_tool_errors() as tool_errors:
+                    result = fn(text)
+                if tool_errors:
+                    logger.warning("Not caching answer: %d FRED tool error(s), first: %s",
+                                   len(tool_errors), tool_errors[0])
+                else:
+                    QUERY_CACHE.set(key, result, expire=ttl)
+            return result
+        return wrapper
+    return decorator
+
+
+@cache_aside(ttl=int(os.getenv("QUERY_CACHE_TTL", 3600)))
+def _run_query(text: str) -> str:
+    """Run the crew for one query and return its text output."""
+    result = _get_crew().crew.kickoff(inputs={"text": text})
+    
+    # Convert result to string for payment completion
+    # Check if result has .raw attribute (CrewOutput), otherwise convert to string
+    return result.raw if hasattr(result, "raw") else str(result)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Agent Logic - This is where you implement your actual agent functionality
@@ -55,7 +142,7 @@ async def process_job(identifier_from_purchaser: str, input_data: dict):
         Result of the processing (string, dict, or any serializable type)
     """
     logger.info(f"Processing job for purchaser: {identifier_from_purchaser}")
-    logger.info(f"Input data: {input_data}")
+    logger.debug("Input data: %s", input_data)
     
     # Extract input
     text = input_data.get("text", "")
@@ -70,23 +157,23 @@ async def process_job(identifier_from_purchaser: str, input_data: dict):
     
     try:
         # Execute the CrewAI task with FRED Economic Data Agents
-        logger.info(f"Starting FRED Economic Data query with input: {text[:100]}...")
-        crew = FREDEconomicCrew(logger=logger)
-        result = crew.crew.kickoff(inputs={"text": text})
+        logger.debug("Starting FRED Economic Data query with input: %s...", text[:100])
+        async with CREW_SEM:
+            loop = asyncio.get_running_loop()
+            result_string = await loop.run_in_executor(CREW_EXECUTOR, _run_query, text)
         logger.info("FRED Economic Data query completed successfully")
         
-        # Convert result to string for payment completion
-        # Check if result has .raw attribute (CrewOutput), otherwise convert to string
-        result_string = result.raw if hasattr(result, "raw") else str(result)
-        
-        logger.info(f"Processing complete. Result length: {len(result_string)} characters")
+        logger.debug("Processing complete. Result length: %d characters", len(result_string))
         
         # Return result - can be string, dict, or any serializable type
         return result_string
     except Exception as e:
         error_msg = f"Error processing FRED query: {str(e)}"
         logger.error(error_msg, exc_info=True)
-        return 
+        return {
+            "status": "error",
+            "error": error_msg
+        }
 
 
 # ─────────────────────────────────────────────────────────────────────────────
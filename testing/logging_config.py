@@ -1,13 +1,32 @@
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-def setup_logging(log_level=logging.INFO):
+# Background listener that writes queued records to the real handlers
+_listener = None
+
+def _stop_listener():
+    """
+    Flush and stop the background log listener and close its handlers (registered
+    with atexit)
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+def setup_logging(log_level=None):
     """
     Configure application-wide logging
     
     Args:
-        log_level: The minimum log level to capture (default: INFO)
+        log_level: The minimum log level to capture (default: the LOG_LEVEL
+            environment variable, or INFO if unset). Use WARNING in production
+            to skip formatting per-request debug/info records.
     
     Returns:
         logger: Configured logger instance
@@ -28,20 +47,39 @@ def setup_logging(log_level=logging.INFO):
     )
     file_handler.setFormatter(file_formatter)
     
-    # Configure root logger
+    # Logging calls only enqueue the record; formatting and the file write happen on
+    # the listener thread, off the request path
+    global _listener
+    _stop_listener()
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    
+    # Configure root logger; an unknown level name falls back to INFO rather than
+    # stopping the server from starting
+    if log_level is None:
+        log_level = (os.getenv("LOG_LEVEL") or "INFO").upper()
+    invalid_level = None
+    if isinstance(log_level, str) and not isinstance(logging.getLevelName(log_level), int):
+        invalid_level, log_level = log_level, logging.INFO
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
     # Remove any existing handlers to prevent duplicates
     for handler in root_logger.handlers[:]:
-        if isinstance(handler, logging.StreamHandler):
+        if isinstance(handler, (logging.StreamHandler, QueueHandler)):
             root_logger.removeHandler(handler)
     
-    # Add the file handler
-    root_logger.addHandler(file_handler)
+    # Add the queue handler feeding the file handler
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    if invalid_level is not None:
+        root_logger.warning("Unknown log level %r, using INFO", invalid_level)
     
     return root_logger
 
+atexit.register(_stop_listener)
+
 def get_logger(name):
     """
     Get a logger for a specific module
@@ -9,16 +9,41 @@ import os
 import json
 import sys
 import io
+import asyncio
 from datetime import datetime
+from dotenv import load_dotenv
 from crew_definition import FREDEconomicCrew
 from logging_config import setup_logging
 
+# Load .env before setup_logging() reads LOG_LEVEL
+load_dotenv()
+
 logger = setup_logging()
 
 # Create output directory for examples
 OUTPUT_DIR = "agent_examples"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Queries used by the "Run example queries" option
+EXAMPLE_QUERIES = (
+    "What is the current unemployment rate in the United States?",
+    "Show me GDP growth data",
+    "What is the inflation rate?",
+    "Get consumer price index trends",
+)
+
+# The crew is built once and reused for every query in the session
+_CREW = None
+
+def get_crew():
+    """
+    Return the shared FRED crew, creating it on first use
+    """
+    global _CREW
+    if _CREW is None:
+        _CREW = FREDEconomicCrew()
+    return _CREW
+
 class TeeWriter:
     """Write to both console and a string buffer"""
     def __init__(self, console, buffer):
@@ -51,7 +76,7 @@ def test_query(query: str, test_name=None):
     
     try:
         input_data = {"text": query}
-        crew = FREDEconomicCrew()
+        crew = get_crew()
         result = crew.crew.kickoff(input_data)
         
         print("\n" + "="*80)
@@ -72,6 +97,22 @@ def test_query(query: str, test_name=None):
         sys.stdout = original_stdout
         sys.stderr = original_stderr
 
+async def run_queries_concurrently(queries):
+    """
+    Run several queries at once, each on its own crew in a worker thread, and return
+    their results in the same order. The LLM and FRED calls are network-bound, so the
+    runs overlap instead of queueing behind each other. A failed run is returned as its
+    exception, so the other results are kept.
+    """
+    def kickoff(query):
+        # Crews hold state while running, so concurrent runs must not share one
+        return FREDEconomicCrew().crew.kickoff({"text": query})
+    
+    return await asyncio.gather(
+        *(asyncio.to_thread(kickoff, query) for query in queries),
+        return_exceptions=True,
+    )
+
 def save_query_result(query: str, result, test_name=None, is_error=False, logs=None):
     """
     Save query result to a file for GitHub hosting
@@ -297,23 +338,20 @@ def main():
             print("❌ No query entered.")
             
     elif choice == "2":
-        # Example queries
-        examples = [
-            "What is the current unemployment rate in the United States?",
-            "Show me GDP growth data",
-            "What is the inflation rate?",
-            "Get consumer price index trends",
-        ]
+        # Example queries - run together, agent output below will interleave
+        print(f"\n🧪 Running {len(EXAMPLE_QUERIES)} example queries concurrently...\n")
+        results = asyncio.run(run_queries_concurrently(EXAMPLE_QUERIES))
         
-        print("\n🧪 Running example queries...\n")
-        for idx, query in enumerate(examples, 1):
-            print(f"\n📋 Example {idx}/{len(examples)}")
-            test_query(query, test_name=f"example_{idx}")
-            
-            if idx < len(examples):
-                cont = input("\nPress Enter to continue to next query (or 'q' to quit): ").strip().lower()
-                if cont == 'q':
-                    break
+        for idx, (query, result) in enumerate(zip(EXAMPLE_QUERIES, results), 1):
+            print("\n" + "="*80)
+            print(f"📋 Example {idx}/{len(EXAMPLE_QUERIES)}: {query}")
+            print("="*80)
+            if isinstance(result, Exception):
+                print(f"❌ Error: {str(result)}")
+                save_query_result(query, f"Error: {str(result)}", test_name=f"example_{idx}", is_error=True)
+            else:
+                print(result)
+                save_query_result(query, result, test_name=f"example_{idx}")
                     
     elif choice == "3":
         # Run showcase tests